@@ -3,20 +3,31 @@ Dependency injection for FastAPI routes.
 This is how you provide instances to your route handlers.
 """
 
+from functools import lru_cache
+from typing import cast
+
+from fastapi import Request
+
 from app.domain.services.risk_scorer import RiskScoringService
 from app.infrastructure.ml.model_loader import ModelLoader
 
 
+@lru_cache(maxsize=1)
 def get_risk_scoring_service() -> RiskScoringService:
     """
     Dependency provider for risk scoring service.
 
-    FastAPI calls this function to get a service instance
-    for each request.
+    The service is stateless, so @lru_cache shares one instance
+    across all requests (FastAPI only caches per request).
     """
     return RiskScoringService()
 
 
-def get_model_loader() -> ModelLoader:
-    """Dependency provider for model loader."""
-    return ModelLoader()
+def get_model_loader(request: Request) -> ModelLoader:
+    """
+    Dependency provider for model loader.
+
+    The model is loaded once during application startup (see lifespan
+    in main.py); this returns that shared instance.
+    """
+    return cast(ModelLoader, request.app.state.model_loader)
@@ -0,0 +1,29 @@
+"""
+CORS middleware that skips Kubernetes probe endpoints.
+"""
+
+from typing import Any, Iterable
+
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class ProbeExemptCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that passes excluded paths straight through.
+
+    Liveness/readiness probes hit the service every few seconds and
+    never come from a browser, so they skip CORS handling entirely
+    (a set lookup instead of parsing request headers).
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: Iterable[str] = (), **kwargs: Any) -> None:
+        super().__init__(app, **kwargs)
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        await super().__call__(scope, receive, send)
@@ -2,12 +2,28 @@
 Health check endpoints for Kubernetes probes.
 """
 
-from fastapi import APIRouter, status
+import orjson
+from fastapi import APIRouter, Request, Response, status
 from app.core.config import get_settings
 
 router = APIRouter()
 settings = get_settings()
 
+# Probe responses only vary with model state, so encode them once at import
+_HEALTH_BODY = orjson.dumps(
+    {
+        "status": "healthy",
+        "service": settings.APP_NAME,
+        "version": settings.APP_VERSION,
+    }
+)
+_READY_BODIES = {
+    model_loaded: orjson.dumps(
+        {"status": "ready", "service": settings.APP_NAME, "model_loaded": model_loaded}
+    )
+    for model_loaded in (True, False)
+}
+
 
 @router.get(
     "/health",
@@ -23,11 +39,7 @@ async def health_check():
     Returns 200 OK if service is running.
     K8s restarts pod if this returns non-200.
     """
-    return {
-        "status": "healthy",
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @router.get(
@@ -37,18 +49,23 @@ async def health_check():
     summary="Readiness check",
     response_description="Service is ready to accept traffic",
 )
-async def readiness_check():
+async def readiness_check(request: Request):
     """
     Kubernetes readiness probe endpoint.
 
     Returns 200 OK if service can handle requests.
     K8s removes pod from load balancer if this returns non-200.
 
+    `model_loaded` reports whether the lifespan startup loaded the ML
+    model. Scoring is still rule-based (Week 1), so a missing model
+    doesn't fail readiness yet.
+
     In production, check:
     - Database connection
     - Model loaded
     - External dependencies available
     """
-    # Week 1: Simple check
-    # Week 5: Add model.is_loaded() check
-    return {"status": "ready", "service": settings.APP_NAME}
+    # Week 5: Return 503 when the model isn't loaded
+    model_loader = getattr(request.app.state, "model_loader", None)
+    model_loaded = model_loader is not None and model_loader.is_model_loaded()
+    return Response(content=_READY_BODIES[model_loaded], media_type="application/json")
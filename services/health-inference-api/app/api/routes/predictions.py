@@ -2,17 +2,22 @@
 Prediction endpoints for ML inference.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, List
+
+import numpy as np
+from fastapi import APIRouter, Body, Depends, HTTPException, status
 
 from app.schemas.prediction import HealthMetricsRequest, RiskAssessmentResponse
 from app.domain.services.risk_scorer import RiskScoringService
 from app.domain.models.prediction import HealthMetrics
 from app.api.deps import get_risk_scoring_service
+from app.core.config import get_settings
 from app.core.exceptions import HealthWatchException
 from app.core.logging import get_logger
 
 router = APIRouter()
 logger = get_logger(__name__)
+settings = get_settings()
 
 
 @router.post(
@@ -23,7 +28,7 @@ logger = get_logger(__name__)
     summary="Predict health risk",
     response_description="Risk assessment based on patient metrics",
 )
-async def predict_health_risk(
+def predict_health_risk(
     request: HealthMetricsRequest,
     risk_service: RiskScoringService = Depends(get_risk_scoring_service),
 ):
@@ -52,8 +57,8 @@ async def predict_health_risk(
         # Business logic (domain layer)
         risk_assessment = risk_service.calculate_risk(health_metrics)
 
-        # Convert domain model to DTO
-        return RiskAssessmentResponse(
+        # Convert domain model to DTO (trusted data, skip re-validation)
+        return RiskAssessmentResponse.model_construct(
             risk_score=risk_assessment.risk_score,
             risk_level=risk_assessment.risk_level.value,
             confidence=risk_assessment.confidence,
@@ -70,3 +75,61 @@ async def predict_health_risk(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error",
         )
+
+
+@router.post(
+    "/predict/batch",
+    response_model=List[RiskAssessmentResponse],
+    status_code=status.HTTP_200_OK,
+    tags=["Predictions"],
+    summary="Predict health risk for a batch of patients",
+    response_description="Risk assessments in the same order as the request",
+)
+def predict_health_risk_batch(
+    requests: Annotated[
+        List[HealthMetricsRequest], Body(max_length=settings.MAX_BATCH_SIZE)
+    ],
+    risk_service: RiskScoringService = Depends(get_risk_scoring_service),
+):
+    """
+    Predict health risk for many patients in one request.
+
+    Scoring is vectorized with NumPy; response objects are still built per row.
+
+    **Request Body:**
+    - List of patient metrics (same fields as `/predict`), at most
+      MAX_BATCH_SIZE items (default 1000)
+
+    **Returns:**
+    - One risk assessment per patient, in request order
+    """
+    try:
+        # Convert DTOs to an (N, 3) array: age, bmi, blood_pressure
+        metrics_array = np.array(
+            [(r.age, r.bmi, r.blood_pressure) for r in requests], dtype=np.float64
+        ).reshape(-1, 3)
+
+        # Business logic (domain layer)
+        risk_assessments = risk_service.calculate_risk_batch(metrics_array)
+
+        # Convert domain models to DTOs (trusted data, skip re-validation)
+        return [
+            RiskAssessmentResponse.model_construct(
+                risk_score=assessment.risk_score,
+                risk_level=assessment.risk_level.value,
+                confidence=assessment.confidence,
+                contributing_factors=assessment.contributing_factors,
+            )
+            for assessment in risk_assessments
+        ]
+
+    except HealthWatchException as e:
+        logger.error(f"Domain error: {e.message}", extra={"extra_data": e.details})
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=e.message)
+
+    except Exception as e:
+        logger.error(f"Unexpected error: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error",
+        )
@@ -26,6 +26,9 @@ class Settings(BaseSettings):
     MODEL_PATH: str = "/models"  # K8s volume mount path
     MODEL_NAME: str = "health_risk_model.pkl"
 
+    # Predictions
+    MAX_BATCH_SIZE: int = 1000  # Max patients per /predict/batch request
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
@@ -0,0 +1,60 @@
+"""
+Caching for FastAPI's per-request dependency inspection.
+
+FastAPI 0.115 re-runs inspect-based checks (generator? coroutine?) on
+every dependency for every request. The answer never changes for a
+given callable, so we memoize it per callable.
+
+These are private FastAPI helpers, so pyproject pins fastapi to 0.115.x
+and any helper that is missing is simply left alone.
+"""
+
+import weakref
+from functools import wraps
+from typing import Any, Callable
+
+from fastapi.dependencies import utils as dependency_utils
+
+# Helpers called from fastapi.dependencies.utils.solve_dependencies
+_INSPECTION_HELPERS = ("is_gen_callable", "is_async_gen_callable", "is_coroutine_callable")
+
+_installed = False
+
+
+def _cache_by_callable(check: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    """Wrap an inspection helper with a WeakKeyDictionary keyed on the callable."""
+    cache: weakref.WeakKeyDictionary[Any, bool] = weakref.WeakKeyDictionary()
+
+    @wraps(check)
+    def cached_check(call: Any) -> bool:
+        try:
+            return cache[call]
+        except KeyError:
+            pass
+        except TypeError:
+            # Not weak-referenceable or not hashable - don't cache
+            return check(call)
+
+        result = cache[call] = check(call)
+        return result
+
+    return cached_check
+
+
+def install_dependency_inspection_cache() -> None:
+    """
+    Patch FastAPI's dependency inspection helpers with cached versions.
+
+    Safe to call more than once, and a no-op for helpers this FastAPI
+    version doesn't have. Drop this once FastAPI caches these checks itself.
+    """
+    global _installed
+    if _installed:
+        return
+
+    for name in _INSPECTION_HELPERS:
+        check = getattr(dependency_utils, name, None)
+        if check is not None:
+            setattr(dependency_utils, name, _cache_by_callable(check))
+
+    _installed = True
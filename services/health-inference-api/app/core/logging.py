@@ -3,11 +3,16 @@ Structured logging configuration.
 Outputs JSON logs that can be parsed by Prometheus/Grafana.
 """
 
+import atexit
+import io
 import logging
+import queue
 import sys
-from typing import Any
-import json
-from datetime import datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+import orjson
 
 
 class JSONFormatter(logging.Formatter):
@@ -20,12 +25,32 @@ class JSONFormatter(logging.Formatter):
     - Searchable in log aggregation systems
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Cached "YYYY-MM-DDTHH:MM:SS" for the last second seen
+        self._last_sec = -1
+        self._last_prefix = ""
+
+    def _timestamp(self, created: float) -> str:
+        """
+        ISO 8601 UTC timestamp for a record's creation time.
+
+        strftime only runs once per second; records within the same
+        second just append their microseconds to the cached prefix.
+        """
+        sec = int(created)
+        if sec != self._last_sec:
+            self._last_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._last_sec = sec
+        return f"{self._last_prefix}.{int((created - sec) * 1_000_000):06d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            # Skip %-formatting when there are no args to interpolate
+            "message": record.getMessage() if record.args else str(record.msg),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
@@ -36,11 +61,113 @@ class JSONFormatter(logging.Formatter):
             log_data["exception"] = self.formatException(record.exc_info)
 
         # Add extra fields (custom context)
-        extra_data = getattr(record, "extra_data", {})
+        extra_data = record.__dict__.get("extra_data")
         if extra_data:
             log_data.update(extra_data)
 
-        return json.dumps(log_data)
+        # orjson is several times faster than json.dumps on small dicts
+        return orjson.dumps(log_data).decode()
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that writes without flushing after every record.
+
+    Flushing is left to the QueueListener, which flushes once the
+    queue is drained - one write() syscall per batch, not per record.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs empty."""
+
+    def __init__(
+        self,
+        log_queue: queue.SimpleQueue[logging.LogRecord],
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+    ) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        # Concretely typed reference; QueueListener.queue only promises put/get
+        self._log_queue = log_queue
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        try:
+            return self._log_queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self._log_queue.get(block)
+
+
+class InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler for an in-process queue.
+
+    The stdlib version pre-formats and strips each record so it can be
+    pickled; records never leave this process, so pass them through and
+    let JSONFormatter run on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def _buffered_stdout() -> Any:
+    """Stdout wrapped in a 64KB write buffer (falls back to sys.stdout)."""
+    try:
+        return io.open(
+            sys.stdout.fileno(),
+            "w",
+            buffering=65536,
+            encoding="utf-8",
+            closefd=False,
+        )
+    except (AttributeError, OSError, ValueError):
+        # stdout replaced by something without a real fd (e.g. pytest capture)
+        return sys.stdout
+
+
+def shutdown_logging() -> None:
+    """
+    Drain queued log records and flush them to stdout.
+
+    The root logger's queue handler is swapped for a plain stdout
+    handler first, so records logged after shutdown are still written
+    instead of piling up in a queue nobody reads.
+    """
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        direct_handler = logging.StreamHandler(sys.stdout)
+        direct_handler.setFormatter(JSONFormatter())
+        root_logger = logging.getLogger()
+        # Swap in one list assignment so no record finds the root without a handler
+        root_logger.handlers = [
+            direct_handler if handler is _queue_handler else handler
+            for handler in root_logger.handlers
+        ]
+        _queue_handler = None
+
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
 
 
 def setup_logging(log_level: str = "INFO") -> None:
@@ -49,7 +176,15 @@ def setup_logging(log_level: str = "INFO") -> None:
 
     In K8s, these logs go to stdout/stderr,
     which K8s captures and forwards to your logging system.
+
+    Request threads only enqueue records; a background listener thread
+    formats them and writes to stdout in batches.
     """
+    global _listener, _queue_handler
+
+    # Stop a listener left over from a previous call
+    shutdown_logging()
+
     # Create root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
@@ -58,10 +193,15 @@ def setup_logging(log_level: str = "INFO") -> None:
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Console handler with JSON formatting
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Console handler with JSON formatting (runs on the listener thread)
+    console_handler = BufferedStreamHandler(_buffered_stdout())
     console_handler.setFormatter(JSONFormatter())
-    root_logger.addHandler(console_handler)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = InProcessQueueHandler(log_queue)
+    root_logger.addHandler(_queue_handler)
+    _listener = BatchingQueueListener(log_queue, console_handler)
+    _listener.start()
 
     # Suppress noisy libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -17,42 +17,30 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthMetrics:
     """
     Patient health metrics (domain entity).
 
-    This is your business model - immutable, validated.
+    This is your business model - immutable. Ranges are validated once at the API
+    boundary (HealthMetricsRequest), so they aren't re-checked here.
     """
 
     age: int
     bmi: float
     blood_pressure_systolic: int
 
-    def __post_init__(self):
-        """Validate domain rules."""
-        if self.age < 0 or self.age > 120:
-            raise ValueError(f"Invalid age: {self.age}")
-        if self.bmi < 10 or self.bmi > 60:
-            raise ValueError(f"Invalid BMI: {self.bmi}")
-        if self.blood_pressure_systolic < 60 or self.blood_pressure_systolic > 250:
-            raise ValueError(f"Invalid blood pressure: {self.blood_pressure_systolic}")
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskAssessment:
     """
     Risk assessment result (domain entity).
+
+    Built by RiskScoringService from its own lookup tables, so the
+    score and confidence are always within 0-1.
     """
 
     risk_score: float  # 0.0 to 1.0
     risk_level: RiskLevel
     confidence: float  # Model confidence
     contributing_factors: list[str]
-
-    def __post_init__(self):
-        """Validate domain rules."""
-        if not 0 <= self.risk_score <= 1:
-            raise ValueError(f"Risk score must be 0-1, got {self.risk_score}")
-        if not 0 <= self.confidence <= 1:
-            raise ValueError(f"Confidence must be 0-1, got {self.confidence}")
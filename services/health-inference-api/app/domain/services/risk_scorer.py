@@ -3,11 +3,132 @@ Business logic for calculating health risk scores.
 This is framework-agnostic - pure Python business rules.
 """
 
+import logging
+from bisect import bisect_right
+from functools import lru_cache
+from typing import Callable
+
+import numpy as np
+
 from app.domain.models.prediction import HealthMetrics, RiskAssessment, RiskLevel
+from app.core.exceptions import InvalidInputError
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Risk lookup tables: (upper bounds, values).
+# A metric below THRESHOLDS[i] falls into bucket i; bisect_right matches the
+# strict "<" comparisons of the original if/elif ladders.
+_AGE_THRESHOLDS = (30, 50, 65)
+_AGE_RISKS = (0.1, 0.3, 0.6, 0.9)
+
+_BMI_THRESHOLDS = (18.5, 25.0, 30.0)
+_BMI_RISKS = (0.4, 0.1, 0.5, 0.8)  # Underweight, normal, overweight, obese
+
+_BP_THRESHOLDS = (120, 130, 140)
+_BP_RISKS = (0.1, 0.3, 0.6, 0.9)  # Normal, elevated, stage 1, stage 2
+
+# Weighted contributions in thousandths (risk * weight * 1000), so the
+# combined score is an exact integer sum instead of float arithmetic.
+_AGE_SCORES_MILLI = tuple(round(risk * 300) for risk in _AGE_RISKS)  # weight 0.3
+_BMI_SCORES_MILLI = tuple(round(risk * 400) for risk in _BMI_RISKS)  # weight 0.4
+_BP_SCORES_MILLI = tuple(round(risk * 300) for risk in _BP_RISKS)  # weight 0.3
+
+_LEVEL_THRESHOLDS_MILLI = (250, 500, 750)
+_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+# NumPy copies of the tables for the batch path
+_AGE_THRESHOLDS_NP = np.array(_AGE_THRESHOLDS, dtype=np.float64)
+_AGE_SCORES_MILLI_NP = np.array(_AGE_SCORES_MILLI, dtype=np.int64)
+_BMI_THRESHOLDS_NP = np.array(_BMI_THRESHOLDS, dtype=np.float64)
+_BMI_SCORES_MILLI_NP = np.array(_BMI_SCORES_MILLI, dtype=np.int64)
+_BP_THRESHOLDS_NP = np.array(_BP_THRESHOLDS, dtype=np.float64)
+_BP_SCORES_MILLI_NP = np.array(_BP_SCORES_MILLI, dtype=np.int64)
+_LEVEL_THRESHOLDS_MILLI_NP = np.array(_LEVEL_THRESHOLDS_MILLI, dtype=np.int64)
+
+
+# Contributing factor messages. Inputs are bounded (and BMI is rounded to
+# one decimal by the API), so each message is formatted once and reused.
+_HEALTHY_FACTOR = "All metrics within healthy ranges"
+
+
+@lru_cache(maxsize=256)
+def _age_factor(age: int) -> str:
+    return f"Age ({age} years) is a significant risk factor"
+
+
+@lru_cache(maxsize=1024)
+def _bmi_factor(bmi: float) -> str:
+    bmi_category = "overweight" if bmi < 30 else "obese"
+    return f"BMI ({bmi:.1f}) indicates {bmi_category}"
+
+
+@lru_cache(maxsize=256)
+def _bp_factor(bp: int) -> str:
+    return f"Blood pressure ({bp} mmHg) is elevated"
+
+
+# A metric is a contributing factor when its risk component exceeds 0.5.
+# Per-bucket bits: age = 1, bmi = 2, bp = 4, OR'ed into a 3-bit mask.
+_AGE_FACTOR_BITS = tuple(1 if risk > 0.5 else 0 for risk in _AGE_RISKS)
+_BMI_FACTOR_BITS = tuple(2 if risk > 0.5 else 0 for risk in _BMI_RISKS)
+_BP_FACTOR_BITS = tuple(4 if risk > 0.5 else 0 for risk in _BP_RISKS)
+
+_HEALTHY_FACTORS = (_HEALTHY_FACTOR,)
+
+# NumPy copies of the factor bits for the batch path
+_AGE_FACTOR_BITS_NP = np.array(_AGE_FACTOR_BITS, dtype=np.int64)
+_BMI_FACTOR_BITS_NP = np.array(_BMI_FACTOR_BITS, dtype=np.int64)
+_BP_FACTOR_BITS_NP = np.array(_BP_FACTOR_BITS, dtype=np.int64)
+_LEVELS_NP = np.array(_LEVELS, dtype=object)
+
+# Factor tuple builder for each of the 8 possible masks
+_FACTOR_BUILDERS: tuple[Callable[[int, float, int], tuple[str, ...]], ...] = (
+    lambda age, bmi, bp: _HEALTHY_FACTORS,  # 0b000: shared, no allocation
+    lambda age, bmi, bp: (_age_factor(age),),
+    lambda age, bmi, bp: (_bmi_factor(bmi),),
+    lambda age, bmi, bp: (_age_factor(age), _bmi_factor(bmi)),
+    lambda age, bmi, bp: (_bp_factor(bp),),
+    lambda age, bmi, bp: (_age_factor(age), _bp_factor(bp)),
+    lambda age, bmi, bp: (_bmi_factor(bmi), _bp_factor(bp)),
+    lambda age, bmi, bp: (_age_factor(age), _bmi_factor(bmi), _bp_factor(bp)),
+)
+
+
+def _identify_factors(
+    age: int, bmi: float, bp: int, age_idx: int, bmi_idx: int, bp_idx: int
+) -> tuple[str, ...]:
+    """Identify which factors contribute most to risk (from risk bucket indices)."""
+    mask = _AGE_FACTOR_BITS[age_idx] | _BMI_FACTOR_BITS[bmi_idx] | _BP_FACTOR_BITS[bp_idx]
+    return _FACTOR_BUILDERS[mask](age, bmi, bp)
+
+
+@lru_cache(maxsize=16384)
+def _score_cached(age: int, bmi: float, bp: int) -> tuple[int, RiskLevel, tuple[str, ...]]:
+    """
+    Score one patient: (score in thousandths, risk level, contributing factors).
+
+    A pure function of three bounded inputs (BMI is rounded to one decimal
+    by the API), so repeated inputs are served straight from the cache.
+    """
+    # Risk bucket per metric
+    age_idx = bisect_right(_AGE_THRESHOLDS, age)
+    bmi_idx = bisect_right(_BMI_THRESHOLDS, bmi)
+    bp_idx = bisect_right(_BP_THRESHOLDS, bp)
+
+    # Combined score (weighted average, in thousandths)
+    score_milli = (
+        _AGE_SCORES_MILLI[age_idx] + _BMI_SCORES_MILLI[bmi_idx] + _BP_SCORES_MILLI[bp_idx]
+    )
+
+    # Determine risk level
+    level_idx = bisect_right(_LEVEL_THRESHOLDS_MILLI, score_milli)
+
+    # Identify contributing factors
+    factors = _identify_factors(age, bmi, bp, age_idx, bmi_idx, bp_idx)
+
+    return score_milli, _LEVELS[level_idx], factors
+
 
 class RiskScoringService:
     """
@@ -26,108 +147,111 @@ class RiskScoringService:
         This is a simplified algorithm for Week 1.
         Week 5: Replace with actual ML model predictions.
         """
-        logger.info(
-            "Calculating risk",
-            extra={
-                "extra_data": {
-                    "age": metrics.age,
-                    "bmi": metrics.bmi,
-                    "bp": metrics.blood_pressure_systolic,
-                }
-            },
-        )
-
-        # Weighted risk calculation
-        age_risk = self._calculate_age_risk(metrics.age)
-        bmi_risk = self._calculate_bmi_risk(metrics.bmi)
-        bp_risk = self._calculate_bp_risk(metrics.blood_pressure_systolic)
+        # Only build log payloads when INFO is actually emitted
+        log_info = logger.isEnabledFor(logging.INFO)
 
-        # Combined score (weighted average)
-        risk_score = (age_risk * 0.3) + (bmi_risk * 0.4) + (bp_risk * 0.3)
-
-        # Determine risk level
-        risk_level = self._categorize_risk(risk_score)
-
-        # Identify contributing factors
-        factors = self._identify_factors(metrics, age_risk, bmi_risk, bp_risk)
+        if log_info:
+            logger.info(
+                "Calculating risk",
+                extra={
+                    "extra_data": {
+                        "age": metrics.age,
+                        "bmi": metrics.bmi,
+                        "bp": metrics.blood_pressure_systolic,
+                    }
+                },
+            )
 
-        logger.info(
-            "Risk calculated",
-            extra={
-                "extra_data": {"risk_score": risk_score, "risk_level": risk_level.value}
-            },
+        score_milli, risk_level, factors = _score_cached(
+            metrics.age, metrics.bmi, metrics.blood_pressure_systolic
         )
+        risk_score = score_milli / 1000
+
+        if log_info:
+            logger.info(
+                "Risk calculated",
+                extra={
+                    "extra_data": {"risk_score": risk_score, "risk_level": risk_level.value}
+                },
+            )
 
         return RiskAssessment(
-            risk_score=round(risk_score, 3),
+            risk_score=risk_score,
             risk_level=risk_level,
             confidence=0.85,  # Placeholder
-            contributing_factors=factors,
+            contributing_factors=list(factors),
         )
 
-    def _calculate_age_risk(self, age: int) -> float:
-        """Age-based risk component."""
-        if age < 30:
-            return 0.1
-        elif age < 50:
-            return 0.3
-        elif age < 65:
-            return 0.6
-        else:
-            return 0.9
-
-    def _calculate_bmi_risk(self, bmi: float) -> float:
-        """BMI-based risk component."""
-        if bmi < 18.5:
-            return 0.4  # Underweight
-        elif bmi < 25:
-            return 0.1  # Normal
-        elif bmi < 30:
-            return 0.5  # Overweight
-        else:
-            return 0.8  # Obese
-
-    def _calculate_bp_risk(self, bp: int) -> float:
-        """Blood pressure-based risk component."""
-        if bp < 120:
-            return 0.1  # Normal
-        elif bp < 130:
-            return 0.3  # Elevated
-        elif bp < 140:
-            return 0.6  # Stage 1 hypertension
-        else:
-            return 0.9  # Stage 2 hypertension
-
-    def _categorize_risk(self, score: float) -> RiskLevel:
-        """Convert numeric score to risk category."""
-        if score < 0.25:
-            return RiskLevel.LOW
-        elif score < 0.5:
-            return RiskLevel.MEDIUM
-        elif score < 0.75:
-            return RiskLevel.HIGH
-        else:
-            return RiskLevel.CRITICAL
-
-    def _identify_factors(
-        self, metrics: HealthMetrics, age_risk: float, bmi_risk: float, bp_risk: float
-    ) -> list[str]:
-        """Identify which factors contribute most to risk."""
-        factors = []
-
-        if age_risk > 0.5:
-            factors.append(f"Age ({metrics.age} years) is a significant risk factor")
-
-        if bmi_risk > 0.5:
-            bmi_category = "overweight" if metrics.bmi < 30 else "obese"
-            factors.append(f"BMI ({metrics.bmi:.1f}) indicates {bmi_category}")
-
-        if bp_risk > 0.5:
-            factors.append(
-                f"Blood pressure ({metrics.blood_pressure_systolic} mmHg) is elevated"
+    def calculate_risk_batch(self, metrics_array: np.ndarray) -> list[RiskAssessment]:
+        """
+        Calculate health risk for many patients at once.
+
+        Risk buckets, scores, levels and factor masks are computed with
+        NumPy for the whole batch; factor messages are only built for rows
+        that have contributing factors. Each row still gets its own
+        RiskAssessment, so the per-row object construction remains.
+
+        Args:
+            metrics_array: (N, 3) array of [age, bmi, blood_pressure_systolic] rows
+
+        Returns:
+            One RiskAssessment per input row, in the same order
+        """
+        metrics_array = np.asarray(metrics_array, dtype=np.float64)
+        if metrics_array.ndim != 2 or metrics_array.shape[1] != 3:
+            raise InvalidInputError(
+                message="Batch metrics must be an (N, 3) array",
+                details={"shape": list(metrics_array.shape)},
             )
 
-        if not factors:
-            factors.append("All metrics within healthy ranges")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Calculating batch risk",
+                extra={"extra_data": {"batch_size": len(metrics_array)}},
+            )
+
+        ages, bmis, bps = metrics_array.T
+
+        # Bucket lookup; side="right" matches bisect_right in the scalar path
+        age_idx = np.searchsorted(_AGE_THRESHOLDS_NP, ages, side="right")
+        bmi_idx = np.searchsorted(_BMI_THRESHOLDS_NP, bmis, side="right")
+        bp_idx = np.searchsorted(_BP_THRESHOLDS_NP, bps, side="right")
 
-        return factors
+        # Combined score (weighted average, in thousandths) and risk level for every row
+        scores_milli = (
+            _AGE_SCORES_MILLI_NP[age_idx]
+            + _BMI_SCORES_MILLI_NP[bmi_idx]
+            + _BP_SCORES_MILLI_NP[bp_idx]
+        )
+        risk_scores = (scores_milli / 1000).tolist()
+        risk_levels = _LEVELS_NP[
+            np.searchsorted(_LEVEL_THRESHOLDS_MILLI_NP, scores_milli, side="right")
+        ].tolist()
+
+        # Factor mask for every row; 0 means all metrics are healthy
+        masks = (
+            _AGE_FACTOR_BITS_NP[age_idx] | _BMI_FACTOR_BITS_NP[bmi_idx] | _BP_FACTOR_BITS_NP[bp_idx]
+        )
+        factors: list[tuple[str, ...]] = [_HEALTHY_FACTORS] * len(masks)
+        (flagged,) = np.nonzero(masks)
+        for row, mask, age, bmi, bp in zip(
+            flagged.tolist(),
+            masks[flagged].tolist(),
+            ages[flagged].astype(np.int64).tolist(),
+            bmis[flagged].tolist(),
+            bps[flagged].astype(np.int64).tolist(),
+            strict=True,
+        ):
+            factors[row] = _FACTOR_BUILDERS[mask](age, bmi, bp)
+
+        return [
+            RiskAssessment(
+                risk_score=risk_score,
+                risk_level=risk_level,
+                confidence=0.85,  # Placeholder
+                contributing_factors=list(row_factors),
+            )
+            for risk_score, risk_level, row_factors in zip(
+                risk_scores, risk_levels, factors, strict=True
+            )
+        ]
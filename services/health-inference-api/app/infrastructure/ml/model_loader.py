@@ -47,7 +47,10 @@ class ModelLoader:
         
         try:
             logger.info(f"Loading model from {model_file}")
-            self._model = joblib.load(model_file)
+            # mmap_mode="r": numpy arrays inside the pickle are memory-mapped
+            # read-only, so workers share page-cache pages instead of each
+            # copying the weights onto its heap (ignored for compressed dumps)
+            self._model = joblib.load(model_file, mmap_mode="r")
             logger.info("Model loaded successfully")
             return self._model
         
@@ -4,16 +4,22 @@ This is what uvicorn runs.
 """
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from app.core.config import get_settings
-from app.core.logging import setup_logging, get_logger
+from app.core.dependency_cache import install_dependency_inspection_cache
+from app.core.logging import setup_logging, shutdown_logging, get_logger
+from app.api.middleware.cors import ProbeExemptCORSMiddleware
 from app.api.routes import health, predictions
+from app.infrastructure.ml.model_loader import ModelLoader
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Memoize FastAPI's per-request dependency inspection
+install_dependency_inspection_cache()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -28,10 +34,16 @@ async def lifespan(app: FastAPI):
     logger.info(f"🚀 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Model path: {settings.MODEL_PATH}")
 
+    # Load the model once so the first request doesn't pay the load latency
+    model_loader = ModelLoader()
+    model_loader.load_model()
+    app.state.model_loader = model_loader
+
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}")
+    shutdown_logging()  # Flush buffered log records before exit
 
 
 # Create FastAPI application
@@ -40,11 +52,13 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="Production-grade ML inference API for healthcare risk prediction",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson: faster than stdlib json
 )
 
-# CORS middleware (for web frontends)
+# CORS middleware (for web frontends); K8s probes bypass it
 app.add_middleware(
-    CORSMiddleware,
+    ProbeExemptCORSMiddleware,
+    exclude_paths=(f"{settings.API_PREFIX}/health", f"{settings.API_PREFIX}/ready"),
     allow_origins=["*"],  # Production: Restrict to specific origins
     allow_credentials=True,
     allow_methods=["*"],
@@ -31,10 +31,8 @@ class HealthMetricsRequest(BaseModel):
     @field_validator("bmi")
     @classmethod
     def validate_bmi(cls, v: float) -> float:
-        """Custom validation for BMI."""
-        if v < 10 or v > 60:
-            raise ValueError("BMI must be between 10 and 60")
-        return round(v, 1)  # Round to 1 decimal place
+        """Round BMI to 1 decimal place (range is enforced by Field)."""
+        return round(v, 1)
 
 
 class RiskAssessmentResponse(BaseModel):
@@ -0,0 +1,15 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """TestClient with the application lifespan (startup/shutdown) running."""
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,26 @@
+"""
+Integration tests for the Kubernetes probe endpoints.
+"""
+
+
+def test_health_check(client):
+    response = client.get("/api/v1/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+
+def test_readiness_reports_model_not_loaded(client):
+    # No model file in the test environment
+    response = client.get("/api/v1/ready")
+
+    assert response.status_code == 200
+    assert response.json()["model_loaded"] is False
+
+
+def test_readiness_reports_model_loaded(client):
+    client.app.state.model_loader._model = object()
+
+    response = client.get("/api/v1/ready")
+
+    assert response.json()["model_loaded"] is True
@@ -0,0 +1,43 @@
+"""
+Integration tests for the prediction endpoints.
+"""
+
+from app.core.config import get_settings
+
+PATIENTS = [
+    {"age": 25, "bmi": 22.0, "blood_pressure": 110},
+    {"age": 45, "bmi": 26.5, "blood_pressure": 130},
+    {"age": 70, "bmi": 33.0, "blood_pressure": 150},
+    {"age": 50, "bmi": 18.4, "blood_pressure": 140},
+]
+
+
+def test_batch_matches_single_predictions(client):
+    response = client.post("/api/v1/predict/batch", json=PATIENTS)
+
+    assert response.status_code == 200
+    expected = [client.post("/api/v1/predict", json=p).json() for p in PATIENTS]
+    assert response.json() == expected
+
+
+def test_batch_empty_list_returns_empty_list(client):
+    response = client.post("/api/v1/predict/batch", json=[])
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_batch_out_of_range_item_returns_422(client):
+    patients = [PATIENTS[0], {"age": 45, "bmi": 75.0, "blood_pressure": 130}]
+
+    response = client.post("/api/v1/predict/batch", json=patients)
+
+    assert response.status_code == 422
+
+
+def test_batch_over_max_size_returns_422(client):
+    patients = [PATIENTS[0]] * (get_settings().MAX_BATCH_SIZE + 1)
+
+    response = client.post("/api/v1/predict/batch", json=patients)
+
+    assert response.status_code == 422
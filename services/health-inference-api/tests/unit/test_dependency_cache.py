@@ -0,0 +1,71 @@
+"""
+Tests for the cached FastAPI dependency inspection helpers.
+"""
+
+from fastapi.dependencies import utils as dependency_utils
+
+import app.main  # noqa: F401  (installs the cache)
+from app.core.dependency_cache import install_dependency_inspection_cache
+
+
+def sync_dependency():
+    return 1
+
+
+async def async_dependency():
+    return 1
+
+
+def gen_dependency():
+    yield 1
+
+
+async def async_gen_dependency():
+    yield 1
+
+
+class ClassDependency:
+    def __call__(self):
+        return 1
+
+
+class UnhashableDependency:
+    __hash__ = None  # Can't be a cache key; must fall back to the plain check
+
+    async def __call__(self):
+        return 1
+
+
+def test_helpers_are_patched():
+    assert hasattr(dependency_utils.is_coroutine_callable, "__wrapped__")
+    assert hasattr(dependency_utils.is_gen_callable, "__wrapped__")
+    assert hasattr(dependency_utils.is_async_gen_callable, "__wrapped__")
+
+
+def test_install_is_idempotent():
+    patched = dependency_utils.is_coroutine_callable
+
+    install_dependency_inspection_cache()
+
+    assert dependency_utils.is_coroutine_callable is patched
+
+
+def test_cached_helpers_classify_dependencies_correctly():
+    cases = [
+        (sync_dependency, (False, False, False)),
+        (async_dependency, (True, False, False)),
+        (gen_dependency, (False, True, False)),
+        (async_gen_dependency, (False, False, True)),
+        (ClassDependency, (False, False, False)),
+        (ClassDependency(), (False, False, False)),
+        (UnhashableDependency(), (True, False, False)),
+    ]
+
+    # Twice: first call fills the cache, second is served from it
+    for _ in range(2):
+        for call, expected in cases:
+            assert (
+                dependency_utils.is_coroutine_callable(call),
+                dependency_utils.is_gen_callable(call),
+                dependency_utils.is_async_gen_callable(call),
+            ) == expected
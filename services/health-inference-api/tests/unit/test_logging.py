@@ -0,0 +1,63 @@
+"""
+Tests for the queued JSON logging setup.
+"""
+
+import logging
+import sys
+
+import orjson
+
+from app.core.logging import (
+    InProcessQueueHandler,
+    JSONFormatter,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def test_records_logged_after_shutdown_are_still_written(capsys):
+    setup_logging("INFO")
+    logger = logging.getLogger("test.logging")
+
+    logger.info("before shutdown")
+    shutdown_logging()
+    logger.warning("after shutdown")
+
+    lines = [orjson.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [line["message"] for line in lines] == ["before shutdown", "after shutdown"]
+    assert not any(
+        isinstance(handler, InProcessQueueHandler) for handler in logging.getLogger().handlers
+    )
+
+
+def _record(msg, args=None, exc_info=None, **extra):
+    record = logging.LogRecord("test.formatter", logging.WARNING, __file__, 1, msg, args, exc_info)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_ignores_exc_info_false():
+    # Logger._log passes exc_info=False through to the record unchanged
+    data = orjson.loads(JSONFormatter().format(_record("x", exc_info=False)))
+
+    assert data["message"] == "x"
+    assert "exception" not in data
+
+
+def test_json_formatter_includes_exception():
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        data = orjson.loads(JSONFormatter().format(_record("failed", exc_info=sys.exc_info())))
+
+    assert "ValueError: boom" in data["exception"]
+
+
+def test_json_formatter_interpolates_args_and_merges_extra_data():
+    record = _record("score %s for %s", ("0.5", "patient"), extra_data={"risk_level": "MEDIUM"})
+
+    data = orjson.loads(JSONFormatter().format(record))
+
+    assert data["message"] == "score 0.5 for patient"
+    assert data["risk_level"] == "MEDIUM"
+    assert data["level"] == "WARNING"